@@ -6,13 +6,27 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN, PLATFORMS
 from .coordinator import IRDeviceCoordinator
-from .services import async_register_services, async_unregister_services
+from .services import async_register_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Remote IR Device Manager integration."""
+    hass.data.setdefault(DOMAIN, {})
+
+    # Register services once for the integration, not per entry
+    async_register_services(hass)
+
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Remote IR Device Manager from a config entry."""
@@ -25,9 +39,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "coordinator": coordinator,
     }
 
-    # Register services
-    await async_register_services(hass)
-
     # Forward setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -39,10 +50,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-        # Unregister services if no entries remain
-        if not hass.data[DOMAIN]:
-            async_unregister_services(hass)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: IRDeviceCoordinator = entry_data["coordinator"]
+        coordinator.async_unload()
+        # The next setup reads storage from disk, so don't leave writes pending
+        await coordinator.async_flush()
 
     return unload_ok
@@ -3,16 +3,29 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
 import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.event import async_track_entity_registry_updated_event
+from homeassistant.util.json import json_loads
+
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
+    from homeassistant.helpers.entity_registry import EventEntityRegistryUpdatedData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Distinguishes "not cached" from a cached None result
+_NOT_CACHED = object()
+
+# Translation table deleting hex digits, used to validate MAC strings
+_HEX_STRIP = str.maketrans("", "", "0123456789abcdef")
+
 
 class BlasterAdapter(ABC):
     """Base class for IR blaster adapters."""
@@ -30,14 +43,39 @@ class BlasterAdapter(ABC):
         Returns the base64-encoded IR code if found, None otherwise.
         """
 
+    async def retrieve_many(
+        self, entity_id: str, pairs: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], str | None]:
+        """Retrieve several learned codes from the same blaster.
+
+        Returns a mapping of (device_name, command_name) to the code, or None.
+        """
+        return {
+            (device_name, command_name): await self.retrieve_learned_code(
+                entity_id, device_name, command_name
+            )
+            for device_name, command_name in pairs
+        }
+
     @abstractmethod
     def supports_entity(self, entity_id: str) -> bool:
         """Check if this adapter supports the given entity."""
 
+    def invalidate(self, entity_id: str) -> None:
+        """Drop any per-entity data cached by the adapter."""
+
 
 class BroadlinkAdapter(BlasterAdapter):
     """Adapter for Broadlink IR blasters."""
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize adapter."""
+        super().__init__(hass)
+        self._mac_cache: dict[str, str | None] = {}
+        self._storage_path = Path(hass.config.path(".storage"))
+        # Parsed codes files keyed by path, with the mtime they were read at
+        self._codes_cache: dict[Path, tuple[int, dict]] = {}
+
     async def retrieve_learned_code(
         self, entity_id: str, device_name: str, command_name: str
     ) -> str | None:
@@ -45,99 +83,122 @@ class BroadlinkAdapter(BlasterAdapter):
 
         Broadlink stores codes in .storage/broadlink_remote_MACADDRESS_codes
         """
+        codes = await self.retrieve_many(entity_id, [(device_name, command_name)])
+        return codes[(device_name, command_name)]
+
+    async def retrieve_many(
+        self, entity_id: str, pairs: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], str | None]:
+        """Retrieve several learned codes with a single codes file read."""
+        pairs = list(pairs)
+        codes: dict[tuple[str, str], str | None] = dict.fromkeys(pairs)
+
         # Get the MAC address from the entity
         mac_address = self._get_mac_from_entity(entity_id)
         if not mac_address:
             _LOGGER.debug("Could not determine MAC address for %s", entity_id)
-            return None
+            return codes
 
         # Build storage path
-        storage_path = Path(self._hass.config.path(".storage"))
-        codes_file = storage_path / f"broadlink_remote_{mac_address}_codes"
+        codes_file = self._storage_path / f"broadlink_remote_{mac_address}_codes"
 
         try:
-            # Use executor for all blocking file I/O (including exists check)
-            data = await self._hass.async_add_executor_job(
-                self._read_codes_file, codes_file
+            # Use executor for all blocking file I/O (including stat)
+            result = await self._hass.async_add_executor_job(
+                self._read_codes_file, codes_file, self._codes_cache.get(codes_file)
             )
-            if data is None:
-                return None
-
-            # Navigate to the code
-            # Structure: {"data": {"device_name": {"command_name": "base64_code"}}}
-            devices = data.get("data", {})
-            device_codes = devices.get(device_name, {})
-            code = device_codes.get(command_name)
-
+        except (json.JSONDecodeError, OSError) as err:
+            _LOGGER.debug("Could not read Broadlink codes file: %s", err)
+            return codes
+
+        if result is None:
+            self._codes_cache.pop(codes_file, None)
+            return codes
+        self._codes_cache[codes_file] = result
+        data = result[1]
+
+        # Navigate to the codes
+        # Structure: {"data": {"device_name": {"command_name": "base64_code"}}}
+        devices = data.get("data", {})
+        for device_name, command_name in pairs:
+            code = devices.get(device_name, {}).get(command_name)
             if code:
                 _LOGGER.debug(
                     "Retrieved code for %s/%s from Broadlink storage",
                     device_name,
                     command_name,
                 )
-                return code
+                codes[(device_name, command_name)] = code
 
-        except (json.JSONDecodeError, OSError) as err:
-            _LOGGER.debug("Could not read Broadlink codes file: %s", err)
+        return codes
 
-        return None
+    @staticmethod
+    def _read_codes_file(
+        codes_file: Path, cached: tuple[int, dict] | None
+    ) -> tuple[int, dict] | None:
+        """Read codes file synchronously (runs in executor).
 
-    def _read_codes_file(self, codes_file: Path) -> dict | None:
-        """Read codes file synchronously (runs in executor)."""
-        if not codes_file.exists():
+        Returns the file's mtime and parsed contents, reusing the cached
+        contents if the mtime is unchanged, or None if the file is missing.
+        """
+        try:
+            mtime_ns = codes_file.stat().st_mtime_ns
+        except FileNotFoundError:
             return None
-        with open(codes_file, encoding="utf-8") as f:
-            return json.load(f)
+
+        if cached is not None and cached[0] == mtime_ns:
+            return cached
+        return mtime_ns, json_loads(codes_file.read_bytes())
+
+    def invalidate(self, entity_id: str) -> None:
+        """Drop the cached MAC address for an entity."""
+        self._mac_cache.pop(entity_id, None)
 
     def _get_mac_from_entity(self, entity_id: str) -> str | None:
+        """Return the MAC address of a Broadlink entity, cached per entity."""
+        mac = self._mac_cache.get(entity_id, _NOT_CACHED)
+        if mac is _NOT_CACHED:
+            mac = self._mac_cache[entity_id] = self._lookup_mac(entity_id)
+        return mac
+
+    def _lookup_mac(self, entity_id: str) -> str | None:
         """Extract MAC address from Broadlink entity."""
         # Get entity registry entry
-        from homeassistant.helpers import entity_registry as er
-
-        registry = er.async_get(self._hass)
-        entry = registry.async_get(entity_id)
+        entry = er.async_get(self._hass).async_get(entity_id)
+        if entry is None:
+            return None
 
-        if entry and entry.unique_id:
+        if entry.unique_id:
             # Broadlink unique_id format includes MAC
-            # Try to extract MAC from unique_id
-            unique_id = entry.unique_id
-            # Format is typically MAC_type or similar
-            parts = unique_id.split("_")
-            if parts:
-                # MAC is usually the first part, formatted as lowercase hex
-                potential_mac = parts[0].lower().replace(":", "")
-                if len(potential_mac) == 12 and all(
-                    c in "0123456789abcdef" for c in potential_mac
-                ):
-                    return potential_mac
+            # Format is typically MAC_type or similar, MAC first
+            potential_mac = entry.unique_id.split("_", 1)[0].lower().replace(":", "")
+            if len(potential_mac) == 12 and not potential_mac.translate(_HEX_STRIP):
+                return potential_mac
+
+        if not entry.device_id:
+            return None
 
         # Fallback: try to get from device
-        if entry and entry.device_id:
-            from homeassistant.helpers import device_registry as dr
-
-            device_registry = dr.async_get(self._hass)
-            device = device_registry.async_get(entry.device_id)
-            if device:
-                for identifier in device.identifiers:
-                    if identifier[0] == "broadlink":
-                        # Second element might be MAC
-                        mac = identifier[1].lower().replace(":", "")
-                        if len(mac) == 12:
-                            return mac
+        device = dr.async_get(self._hass).async_get(entry.device_id)
+        if device:
+            for identifier in device.identifiers:
+                if identifier[0] == "broadlink":
+                    # Second element might be MAC
+                    mac = identifier[1].lower().replace(":", "")
+                    if len(mac) == 12:
+                        return mac
 
         return None
 
     def supports_entity(self, entity_id: str) -> bool:
         """Check if entity is a Broadlink remote."""
-        from homeassistant.helpers import entity_registry as er
-
-        registry = er.async_get(self._hass)
-        entry = registry.async_get(entity_id)
-
-        if entry:
-            return entry.platform == "broadlink"
+        return self.supports_entity_static(self._hass, entity_id)
 
-        return False
+    @classmethod
+    def supports_entity_static(cls, hass: HomeAssistant, entity_id: str) -> bool:
+        """Check if entity is a Broadlink remote without an adapter instance."""
+        entry = er.async_get(hass).entities.get(entity_id)
+        return entry is not None and entry.platform == "broadlink"
 
 
 class GenericAdapter(BlasterAdapter):
@@ -170,20 +231,70 @@ class AdapterRegistry:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize registry."""
         self._hass = hass
-        self._adapters: list[BlasterAdapter] = [
-            BroadlinkAdapter(hass),
+        # Adapters are only instantiated once an entity they support shows up
+        self._adapter_factories: list[
+            tuple[Callable[[HomeAssistant, str], bool], type[BlasterAdapter]]
+        ] = [
+            (BroadlinkAdapter.supports_entity_static, BroadlinkAdapter),
             # Add more adapters here as they're implemented:
-            # TuyaAdapter(hass),
-            # SwitchbotAdapter(hass),
+            # (TuyaAdapter.supports_entity_static, TuyaAdapter),
+            # (SwitchbotAdapter.supports_entity_static, SwitchbotAdapter),
         ]
+        self._adapters: dict[type[BlasterAdapter], BlasterAdapter] = {}
         self._generic = GenericAdapter(hass)
+        self._adapter_cache: dict[str, BlasterAdapter] = {}
+        self._registry_unsubs: dict[str, CALLBACK_TYPE] = {}
 
     def get_adapter(self, entity_id: str) -> BlasterAdapter:
-        """Get the appropriate adapter for an entity."""
-        for adapter in self._adapters:
-            if adapter.supports_entity(entity_id):
-                return adapter
-        return self._generic
+        """Get the appropriate adapter for an entity.
+
+        The resolved adapter is cached per entity_id and invalidated when
+        the entity registry entry changes.
+        """
+        cached = self._adapter_cache.get(entity_id)
+        if cached is not None:
+            return cached
+
+        adapter: BlasterAdapter = self._generic
+        for supports_entity, adapter_cls in self._adapter_factories:
+            if supports_entity(self._hass, entity_id):
+                adapter = self._adapters.get(adapter_cls)
+                if adapter is None:
+                    adapter = self._adapters[adapter_cls] = adapter_cls(self._hass)
+                break
+
+        self._adapter_cache[entity_id] = adapter
+        if entity_id not in self._registry_unsubs:
+            self._registry_unsubs[entity_id] = (
+                async_track_entity_registry_updated_event(
+                    self._hass, entity_id, self._async_entity_registry_updated
+                )
+            )
+        return adapter
+
+    def invalidate(self, entity_id: str) -> None:
+        """Drop the cached adapter for an entity."""
+        if (adapter := self._adapter_cache.pop(entity_id, None)) is not None:
+            adapter.invalidate(entity_id)
+        if (unsub := self._registry_unsubs.pop(entity_id, None)) is not None:
+            unsub()
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Invalidate cached adapters when a tracked entity changes."""
+        self.invalidate(event.data["entity_id"])
+        if old_entity_id := event.data.get("old_entity_id"):
+            self.invalidate(old_entity_id)
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop tracking entity registry updates and drop cached adapters."""
+        for entity_id in list(self._registry_unsubs):
+            self.invalidate(entity_id)
+        self._adapter_cache.clear()
+        self._adapters.clear()
 
     async def retrieve_learned_code(
         self, entity_id: str, device_name: str, command_name: str
@@ -193,3 +304,10 @@ class AdapterRegistry:
         return await adapter.retrieve_learned_code(
             entity_id, device_name, command_name
         )
+
+    async def retrieve_many(
+        self, entity_id: str, pairs: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], str | None]:
+        """Retrieve several learned codes, resolving the adapter once."""
+        adapter = self.get_adapter(entity_id)
+        return await adapter.retrieve_many(entity_id, pairs)
@@ -5,10 +5,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import Event, State, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_state_change_event
 
+from .const import SIGNAL_DEVICE_UPDATED
 from .storage import VirtualDevice
 
 if TYPE_CHECKING:
+    from homeassistant.core import EventStateChangedData
+
     from .coordinator import IRDeviceCoordinator
 
 
@@ -25,18 +32,59 @@ class IRDeviceEntityMixin:
     _virtual_device: VirtualDevice
     _entry: ConfigEntry
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available based on IR blaster state.
+    _attr_available = True
+
+    async def async_added_to_hass(self) -> None:
+        """Track IR blaster availability and device changes once added."""
+        await super().async_added_to_hass()
+        blaster_entity_id = self._virtual_device.ir_blaster_entity_id
+        self._attr_available = self._blaster_available(
+            self.hass.states.get(blaster_entity_id)
+        )
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [blaster_entity_id], self._async_blaster_state_changed
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATED.format(self._virtual_device.id),
+                self._async_device_updated,
+            )
+        )
+
+    @staticmethod
+    def _blaster_available(state: State | None) -> bool:
+        """Return if the IR blaster is available.
 
         During startup, state may not exist yet - assume available.
         """
-        state = self._coordinator.hass.states.get(
-            self._virtual_device.ir_blaster_entity_id
-        )
         if state is None:
             return True
-        return state.state != "unavailable"
+        return state.state != STATE_UNAVAILABLE
+
+    @callback
+    def _async_blaster_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Update availability when the IR blaster state changes."""
+        available = self._blaster_available(event.data["new_state"])
+        if available != self._attr_available:
+            self._attr_available = available
+            self.async_write_ha_state()
+
+    @callback
+    def _async_device_updated(self) -> None:
+        """Refresh the entity after its virtual device changed in place."""
+        self._handle_device_update()
+        self.async_write_ha_state()
+
+    def _handle_device_update(self) -> None:
+        """Apply virtual device changes to the entity.
+
+        Entities that derive attributes from the device override this.
+        """
 
     async def _send_ir_command(self, command_name: str) -> None:
         """Send an IR command via the coordinator."""
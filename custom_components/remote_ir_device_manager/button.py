@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .base_entity import IRDeviceEntityMixin
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_COMMAND_ADDED
 from .storage import IRCommand, VirtualDevice
 
 if TYPE_CHECKING:
@@ -29,20 +32,60 @@ async def async_setup_entry(
     """Set up button entities from a config entry."""
     coordinator: IRDeviceCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    entities: list[IRCommandButton] = []
-
+    # Add buttons one virtual device at a time, yielding to the event loop
+    # between devices so large remotes don't block it during setup
     for device in coordinator.devices.values():
-        for command in device.commands.values():
-            entities.append(
+        device_prefix = f"{entry.entry_id}_{device.id}"
+        # One DeviceInfo shared by every button of the virtual device
+        device_info = _device_info(device_prefix, device)
+        async_add_entities(
+            IRCommandButton(
+                coordinator=coordinator,
+                virtual_device=device,
+                command=command,
+                entry=entry,
+                device_prefix=device_prefix,
+                device_info=device_info,
+            )
+            for command in device.commands.values()
+        )
+        await asyncio.sleep(0)
+
+    @callback
+    def _async_add_command_button(device: VirtualDevice, command: IRCommand) -> None:
+        """Add the button for a command added after setup."""
+        device_prefix = f"{entry.entry_id}_{device.id}"
+        async_add_entities(
+            [
                 IRCommandButton(
                     coordinator=coordinator,
                     virtual_device=device,
                     command=command,
                     entry=entry,
+                    device_prefix=device_prefix,
+                    device_info=_device_info(device_prefix, device),
                 )
-            )
+            ]
+        )
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_COMMAND_ADDED.format(entry.entry_id),
+            _async_add_command_button,
+        )
+    )
 
-    async_add_entities(entities)
+
+def _device_info(device_prefix: str, device: VirtualDevice) -> DeviceInfo:
+    """Return the device info grouping a virtual device's buttons."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, device_prefix)},
+        name=device.name,
+        manufacturer="Remote IR Device Manager",
+        model="Virtual Remote",
+        sw_version="1.0",
+    )
 
 
 class IRCommandButton(IRDeviceEntityMixin, ButtonEntity):
@@ -56,6 +99,8 @@ class IRCommandButton(IRDeviceEntityMixin, ButtonEntity):
         virtual_device: VirtualDevice,
         command: IRCommand,
         entry: ConfigEntry,
+        device_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
         self._coordinator = coordinator
@@ -64,29 +109,32 @@ class IRCommandButton(IRDeviceEntityMixin, ButtonEntity):
         self._entry = entry
 
         # Unique ID: entry_id + device_id + command_id
-        self._attr_unique_id = (
-            f"{entry.entry_id}_{virtual_device.id}_{command.id}"
-        )
+        self._attr_unique_id = device_prefix + "_" + command.id
         self._attr_name = command.name
-        self._attr_icon = command.icon or "mdi:remote"
 
         # Device info groups buttons under the virtual device
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{entry.entry_id}_{virtual_device.id}")},
-            name=virtual_device.name,
-            manufacturer="Remote IR Device Manager",
-            model="Virtual Remote",
-            sw_version="1.0",
-        )
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "command_type": self._command.command_type,
+        self._attr_device_info = device_info
+
+        self._handle_device_update()
+
+    @callback
+    def _async_device_updated(self) -> None:
+        """Refresh the button, or remove it if its command was deleted."""
+        command = self._virtual_device.commands.get(self._command.name.lower())
+        if command is not self._command:
+            er.async_get(self.hass).async_remove(self.entity_id)
+            return
+        super()._async_device_updated()
+
+    def _handle_device_update(self) -> None:
+        """Set the icon and attributes, which can be edited in place."""
+        command = self._command
+        self._attr_icon = command.icon or "mdi:remote"
+        self._attr_extra_state_attributes = {
+            "command_type": command.command_type,
             "ir_blaster": self._virtual_device.ir_blaster_entity_id,
             "virtual_device": self._virtual_device.name,
-            "learned_at": self._command.learned_at,
+            "learned_at": command.learned_at,
         }
 
     async def async_press(self) -> None:
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import wraps
 import logging
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 
@@ -13,8 +16,13 @@ from homeassistant.config_entries import (
     ConfigFlowResult,
     OptionsFlow,
 )
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, Event, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import (
+    async_track_state_added_domain,
+    async_track_state_removed_domain,
+)
 from homeassistant.helpers.selector import IconSelector, IconSelectorConfig
 
 from .const import (
@@ -38,10 +46,101 @@ from .const import (
     BRIGHTNESS_MODE_BOTH,
     DOMAIN,
 )
-from .storage import EntityConfig
+from .coordinator import InvalidIRCodeError, IRDeviceCoordinator, LearnTimeoutError
+from .storage import EntityConfig, VirtualDevice
+
+if TYPE_CHECKING:
+    from homeassistant.core import EventStateChangedData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Dropdown labels shared by every render
+_COMMAND_TYPE_LABELS = MappingProxyType(
+    {COMMAND_TYPE_IR: "IR (Infrared)", COMMAND_TYPE_RF: "RF (Radio Frequency)"}
+)
+_BRIGHTNESS_MODE_LABELS = MappingProxyType(
+    {
+        BRIGHTNESS_MODE_NONE: "No brightness control",
+        BRIGHTNESS_MODE_DISCRETE: "Discrete levels",
+        BRIGHTNESS_MODE_RELATIVE: "Up/Down buttons",
+        BRIGHTNESS_MODE_BOTH: "Both",
+    }
+)
+_COLOR_TEMP_MODE_LABELS = MappingProxyType(
+    {
+        BRIGHTNESS_MODE_NONE: "No color temp control",
+        BRIGHTNESS_MODE_DISCRETE: "Discrete presets (cool to warm)",
+        BRIGHTNESS_MODE_RELATIVE: "Warmer/Cooler buttons",
+        BRIGHTNESS_MODE_BOTH: "Both",
+    }
+)
+
+# Level modes that use discrete level lists / up-down commands
+_DISCRETE_MODES = frozenset({BRIGHTNESS_MODE_DISCRETE, BRIGHTNESS_MODE_BOTH})
+_RELATIVE_MODES = frozenset({BRIGHTNESS_MODE_RELATIVE, BRIGHTNESS_MODE_BOTH})
+
+# Selectors hold no per-form state, so one instance is shared
+_ICON_SELECTOR = IconSelector(IconSelectorConfig())
+
+# Static form schemas, built once. Steps with dynamic choices extend a base.
+_EMPTY_SCHEMA = vol.Schema({})
+
+_ADD_DEVICE_SCHEMA_BASE = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_NAME): str,
+    }
+)
+
+_LEARN_COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_COMMAND_NAME): str,
+        vol.Optional(CONF_COMMAND_TYPE, default=COMMAND_TYPE_IR): vol.In(
+            _COMMAND_TYPE_LABELS
+        ),
+        vol.Optional("icon"): _ICON_SELECTOR,
+    }
+)
+
+
+def _parse_csv(value: str) -> list[str]:
+    """Split a comma-separated string into stripped, non-empty items."""
+    if not value:
+        return []
+    return [item for item in (part.strip() for part in value.split(",")) if item]
+
+
+def _requires_device(
+    func: Callable[
+        [
+            RemoteIRDeviceManagerOptionsFlow,
+            dict[str, Any] | None,
+            VirtualDevice,
+            IRDeviceCoordinator,
+        ],
+        Awaitable[ConfigFlowResult],
+    ],
+) -> Callable[
+    [RemoteIRDeviceManagerOptionsFlow, dict[str, Any] | None],
+    Coroutine[Any, Any, ConfigFlowResult],
+]:
+    """Resolve the selected device before running an options flow step.
+
+    Returns to the init menu if the device no longer exists.
+    """
+
+    @wraps(func)
+    async def wrapper(
+        self: RemoteIRDeviceManagerOptionsFlow,
+        user_input: dict[str, Any] | None = None,
+    ) -> ConfigFlowResult:
+        coordinator = self._get_coordinator()
+        device = self._get_selected_device(coordinator)
+        if device is None:
+            return await self.async_step_init()
+        return await func(self, user_input, device, coordinator)
+
+    return wrapper
+
 
 class RemoteIRDeviceManagerConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Remote IR Device Manager."""
@@ -80,36 +179,97 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
         """Initialize options flow."""
         self._config_entry = config_entry
         self._selected_device_id: str | None = None
+        # Device the placeholders were built for
+        self._selected_device: VirtualDevice | None = None
+        self._device_placeholders: dict[str, str] = {}
         self._selected_command_name: str | None = None
         self._prefilled_command_data: dict[str, Any] | None = None
+        self._blasters_cache: dict[str, str] | None = None
+        self._blasters_unsubs: list[CALLBACK_TYPE] = []
+        self._coordinator: IRDeviceCoordinator | None = None
 
-    def _get_coordinator(self) -> "IRDeviceCoordinator":
-        """Get the coordinator from hass.data."""
-        from .coordinator import IRDeviceCoordinator
+    def _get_coordinator(self) -> IRDeviceCoordinator:
+        """Get the coordinator from hass.data.
 
-        coordinator: IRDeviceCoordinator = self.hass.data[DOMAIN][self._config_entry.entry_id]["coordinator"]
-        return coordinator
+        The reference is cached for the flow and re-resolved after the
+        entry reloads, since a reload replaces the coordinator.
+        """
+        if self._coordinator is None or self._coordinator.unloaded:
+            self._coordinator = self.hass.data[DOMAIN][self._config_entry.entry_id]["coordinator"]
+        return self._coordinator
+
+    def _select_device(self, device_id: str | None) -> None:
+        """Set the device the device-level steps operate on."""
+        self._selected_device_id = device_id
+        self._selected_device = None
+        self._device_placeholders = {}
+
+    def _get_selected_device(
+        self, coordinator: IRDeviceCoordinator
+    ) -> VirtualDevice | None:
+        """Return the selected device, or None if it no longer exists.
+
+        The device is looked up on every step so one deleted or replaced
+        elsewhere is never acted on; only the placeholders are cached.
+        """
+        device = coordinator.get_device(self._selected_device_id)
+        if device is not self._selected_device:
+            self._selected_device = device
+            self._device_placeholders = {"device_name": device.name} if device else {}
+        return device
 
     def _get_ir_blasters(self) -> dict[str, str]:
-        """Get available IR blaster entities (excluding our own virtual remotes)."""
-        from homeassistant.helpers import entity_registry as er
+        """Get available IR blaster entities (excluding our own virtual remotes).
 
-        blasters = {}
-        entity_ids = self.hass.states.async_entity_ids("remote")
+        The result is reused until a remote entity is added or removed, so
+        form re-renders don't rescan every remote entity.
+        """
+        if self._blasters_cache is None:
+            self._blasters_cache = self._scan_ir_blasters()
+            if not self._blasters_unsubs:
+                self._blasters_unsubs = [
+                    async_track_state_added_domain(
+                        self.hass, "remote", self._async_remotes_changed
+                    ),
+                    async_track_state_removed_domain(
+                        self.hass, "remote", self._async_remotes_changed
+                    ),
+                ]
+        return self._blasters_cache
+
+    @callback
+    def _async_remotes_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Drop the cached IR blaster list when a remote comes or goes."""
+        self._blasters_cache = None
 
-        # Get entity registry to filter out our own virtual remotes
+    @callback
+    def async_remove(self) -> None:
+        """Stop tracking remote entities when the flow is removed."""
+        for unsub in self._blasters_unsubs:
+            unsub()
+        self._blasters_unsubs = []
+
+    def _scan_ir_blasters(self) -> dict[str, str]:
+        """Scan remote entities for IR blasters."""
+        # Our own virtual remotes, from the registry's per-entry index
         ent_reg = er.async_get(self.hass)
+        own_remotes = {
+            entry.entity_id
+            for entry in er.async_entries_for_config_entry(
+                ent_reg, self._config_entry.entry_id
+            )
+            if entry.domain == "remote"
+        }
 
-        for entity_id in entity_ids:
+        blasters = {}
+        states_get = self.hass.states.get
+        for entity_id in self.hass.states.async_entity_ids("remote"):
             # Skip entities created by this integration
-            entry = ent_reg.async_get(entity_id)
-            if entry and entry.platform == DOMAIN:
+            if entity_id in own_remotes:
                 continue
 
-            state = self.hass.states.get(entity_id)
-            if state:
-                friendly_name = state.attributes.get("friendly_name", entity_id)
-                blasters[entity_id] = friendly_name
+            if state := states_get(entity_id):
+                blasters[entity_id] = state.attributes.get("friendly_name", entity_id)
 
         return blasters
 
@@ -128,18 +288,15 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
         result: dict[str, Any] = {}
         mode = user_input.get(mode_key, BRIGHTNESS_MODE_NONE)
 
-        if mode in (BRIGHTNESS_MODE_DISCRETE, BRIGHTNESS_MODE_BOTH):
-            levels_str = user_input.get(levels_key, "")
-            if levels_str:
-                levels = [level.strip() for level in levels_str.split(",") if level.strip()]
-                if levels:
-                    result[levels_key] = levels
+        if mode in _DISCRETE_MODES:
+            levels = _parse_csv(user_input.get(levels_key, ""))
+            if levels:
+                result[levels_key] = levels
 
-        if mode in (BRIGHTNESS_MODE_RELATIVE, BRIGHTNESS_MODE_BOTH):
-            if user_input.get(up_key):
-                result[up_key] = user_input[up_key]
-            if user_input.get(down_key):
-                result[down_key] = user_input[down_key]
+        if mode in _RELATIVE_MODES:
+            for key in (up_key, down_key):
+                if value := user_input.get(key):
+                    result[key] = value
 
         return result
 
@@ -163,7 +320,7 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             errors["base"] = "no_ir_blasters"
             return self.async_show_form(
                 step_id="add_device",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors=errors,
             )
 
@@ -171,7 +328,7 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             coordinator = self._get_coordinator()
 
             # Check if name already exists
-            if coordinator.get_device_by_name(user_input[CONF_DEVICE_NAME]):
+            if user_input[CONF_DEVICE_NAME].lower() in coordinator.device_names:
                 errors[CONF_DEVICE_NAME] = "device_name_exists"
             else:
                 try:
@@ -179,6 +336,7 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
                         name=user_input[CONF_DEVICE_NAME],
                         ir_blaster_entity_id=user_input[CONF_IR_BLASTER],
                     )
+                    self._blasters_cache = None
                     return self.async_create_entry(title="", data={})
                 except HomeAssistantError as err:
                     _LOGGER.error("Failed to add device: %s", err)
@@ -187,9 +345,8 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
                     _LOGGER.exception("Unexpected error adding device")
                     errors["base"] = "unknown"
 
-        schema = vol.Schema(
+        schema = _ADD_DEVICE_SCHEMA_BASE.extend(
             {
-                vol.Required(CONF_DEVICE_NAME): str,
                 vol.Required(CONF_IR_BLASTER): vol.In(ir_blasters),
             }
         )
@@ -207,21 +364,18 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
         errors: dict[str, str] = {}
         coordinator = self._get_coordinator()
 
-        devices = {
-            device.id: device.name
-            for device in coordinator.devices.values()
-        }
+        devices = coordinator.device_choices
 
         if not devices:
             errors["base"] = "no_devices"
             return self.async_show_form(
                 step_id="manage_device",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors=errors,
             )
 
         if user_input is not None:
-            self._selected_device_id = user_input[CONF_DEVICE_ID]
+            self._select_device(user_input[CONF_DEVICE_ID])
             return await self.async_step_device_menu()
 
         schema = vol.Schema(
@@ -236,16 +390,14 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             errors=errors,
         )
 
+    @_requires_device
     async def async_step_device_menu(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None,
+        device: VirtualDevice,
+        coordinator: IRDeviceCoordinator,
     ) -> ConfigFlowResult:
         """Show menu for managing a specific device."""
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
-
-        if device is None:
-            return await self.async_step_init()
-
         return self.async_show_menu(
             step_id="device_menu",
             menu_options=[
@@ -256,22 +408,21 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
                 "configure_device_type",
                 "back",
             ],
-            description_placeholders={"device_name": device.name},
+            description_placeholders=self._device_placeholders,
         )
 
     async def async_step_back(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Go back to main menu."""
-        self._selected_device_id = None
+        self._select_device(None)
         return await self.async_step_init()
 
     async def async_step_command_added(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Show menu after successfully adding a command."""
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
+        device = self._get_selected_device(self._get_coordinator())
 
         if device is None:
             return self.async_create_entry(title="", data={})
@@ -279,7 +430,7 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
         return self.async_show_menu(
             step_id="command_added",
             menu_options=["learn_command", "add_command_manual", "finish"],
-            description_placeholders={"device_name": device.name},
+            description_placeholders=self._device_placeholders,
         )
 
     async def async_step_finish(
@@ -288,16 +439,15 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
         """Finish adding commands and exit."""
         return self.async_create_entry(title="", data={})
 
+    @_requires_device
     async def async_step_learn_command(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None,
+        device: VirtualDevice,
+        coordinator: IRDeviceCoordinator,
     ) -> ConfigFlowResult:
         """Handle learning a new command."""
         errors: dict[str, str] = {}
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
-
-        if device is None:
-            return await self.async_step_init()
 
         if user_input is not None:
             command_name = user_input[CONF_COMMAND_NAME]
@@ -305,12 +455,12 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             icon = user_input.get("icon")
 
             # Check for duplicate command
-            if coordinator.command_name_exists(self._selected_device_id, command_name):
+            if device.has_command(command_name):
                 errors[CONF_COMMAND_NAME] = "command_name_exists"
             else:
                 try:
                     result = await coordinator.async_learn_command(
-                        self._selected_device_id,
+                        device.id,
                         command_name,
                         command_type,
                         timeout=30,
@@ -320,7 +470,7 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
                         # Update icon if provided
                         if icon and result.icon != icon:
                             await coordinator.async_update_command(
-                                self._selected_device_id, command_name, icon=icon
+                                device.id, command_name, icon=icon
                             )
 
                         return await self.async_step_command_added()
@@ -333,43 +483,32 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
                             "icon": icon or "",
                         }
                         return await self.async_step_add_command_manual()
+                except LearnTimeoutError as err:
+                    _LOGGER.error("Learning timed out: %s", err)
+                    errors["base"] = "learn_timeout"
                 except HomeAssistantError as err:
                     _LOGGER.error("Learning failed: %s", err)
-                    if "timeout" in str(err).lower():
-                        errors["base"] = "learn_timeout"
-                    else:
-                        errors["base"] = "learn_failed"
+                    errors["base"] = "learn_failed"
                 except Exception:
                     _LOGGER.exception("Unexpected error during learning")
                     errors["base"] = "learn_failed"
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_COMMAND_NAME): str,
-                vol.Optional(CONF_COMMAND_TYPE, default=COMMAND_TYPE_IR): vol.In(
-                    {COMMAND_TYPE_IR: "IR (Infrared)", COMMAND_TYPE_RF: "RF (Radio Frequency)"}
-                ),
-                vol.Optional("icon"): IconSelector(IconSelectorConfig()),
-            }
-        )
-
         return self.async_show_form(
             step_id="learn_command",
-            data_schema=schema,
+            data_schema=_LEARN_COMMAND_SCHEMA,
             errors=errors,
-            description_placeholders={"device_name": device.name},
+            description_placeholders=self._device_placeholders,
         )
 
+    @_requires_device
     async def async_step_add_command_manual(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None,
+        device: VirtualDevice,
+        coordinator: IRDeviceCoordinator,
     ) -> ConfigFlowResult:
         """Handle adding a command manually with base64 code."""
         errors: dict[str, str] = {}
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
-
-        if device is None:
-            return await self.async_step_init()
 
         # Check if we have prefilled data from learn_command redirect
         prefilled_data = self._prefilled_command_data
@@ -382,24 +521,24 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             icon = user_input.get("icon")
 
             # Check for duplicate command
-            if coordinator.command_name_exists(self._selected_device_id, command_name):
+            if device.has_command(command_name):
                 errors[CONF_COMMAND_NAME] = "command_name_exists"
             else:
                 try:
                     await coordinator.async_add_command(
-                        self._selected_device_id,
+                        device.id,
                         command_name,
                         code,
                         command_type,
                         icon,
                     )
                     return await self.async_step_command_added()
+                except InvalidIRCodeError as err:
+                    _LOGGER.error("Failed to add command: %s", err)
+                    errors[CONF_COMMAND_CODE] = "invalid_code"
                 except HomeAssistantError as err:
                     _LOGGER.error("Failed to add command: %s", err)
-                    if "base64" in str(err).lower():
-                        errors[CONF_COMMAND_CODE] = "invalid_code"
-                    else:
-                        errors["base"] = "unknown"
+                    errors["base"] = "unknown"
                 except Exception:
                     _LOGGER.exception("Unexpected error adding command")
                     errors["base"] = "unknown"
@@ -416,10 +555,8 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
                 vol.Optional(
                     CONF_COMMAND_TYPE,
                     default=defaults.get(CONF_COMMAND_TYPE, COMMAND_TYPE_IR),
-                ): vol.In(
-                    {COMMAND_TYPE_IR: "IR (Infrared)", COMMAND_TYPE_RF: "RF (Radio Frequency)"}
-                ),
-                vol.Optional("icon"): IconSelector(IconSelectorConfig()),
+                ): vol.In(_COMMAND_TYPE_LABELS),
+                vol.Optional("icon"): _ICON_SELECTOR,
             }
         )
 
@@ -427,32 +564,28 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             step_id="add_command_manual",
             data_schema=schema,
             errors=errors,
-            description_placeholders={"device_name": device.name},
+            description_placeholders=self._device_placeholders,
         )
 
+    @_requires_device
     async def async_step_edit_command(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None,
+        device: VirtualDevice,
+        coordinator: IRDeviceCoordinator,
     ) -> ConfigFlowResult:
         """Handle selecting a command to edit."""
         errors: dict[str, str] = {}
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
 
-        if device is None:
-            return await self.async_step_init()
-
-        commands = {
-            cmd.name: f"{cmd.name} ({cmd.command_type.upper()})"
-            for cmd in device.commands.values()
-        }
+        commands = device.command_choices
 
         if not commands:
             errors["base"] = "no_commands"
             return self.async_show_form(
                 step_id="edit_command",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors=errors,
-                description_placeholders={"device_name": device.name},
+                description_placeholders=self._device_placeholders,
             )
 
         if user_input is not None:
@@ -469,32 +602,33 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             step_id="edit_command",
             data_schema=schema,
             errors=errors,
-            description_placeholders={"device_name": device.name},
+            description_placeholders=self._device_placeholders,
         )
 
+    @_requires_device
     async def async_step_edit_command_form(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None,
+        device: VirtualDevice,
+        coordinator: IRDeviceCoordinator,
     ) -> ConfigFlowResult:
         """Handle editing a command's properties."""
         errors: dict[str, str] = {}
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
-
-        if device is None:
-            return await self.async_step_init()
 
         command = device.commands.get(self._selected_command_name.lower())
         if command is None:
             return await self.async_step_device_menu()
 
         if user_input is not None:
-            new_icon = user_input.get("icon")
+            # Treat an empty selection as no icon
+            new_icon = user_input.get("icon") or None
             try:
-                await coordinator.async_update_command(
-                    self._selected_device_id,
-                    self._selected_command_name,
-                    icon=new_icon,
-                )
+                if new_icon != (command.icon or None):
+                    await coordinator.async_update_command(
+                        device.id,
+                        self._selected_command_name,
+                        icon=new_icon,
+                    )
                 self._selected_command_name = None
                 return await self.async_step_device_menu()
             except Exception:
@@ -503,9 +637,7 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
 
         schema = vol.Schema(
             {
-                vol.Optional("icon", default=command.icon or ""): IconSelector(
-                    IconSelectorConfig()
-                ),
+                vol.Optional("icon", default=command.icon or ""): _ICON_SELECTOR,
             }
         )
 
@@ -519,21 +651,20 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             },
         )
 
+    @_requires_device
     async def async_step_configure_device_type(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None,
+        device: VirtualDevice,
+        coordinator: IRDeviceCoordinator,
     ) -> ConfigFlowResult:
         """Configure the device type (generic, light, cover, fan)."""
         errors: dict[str, str] = {}
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
-
-        if device is None:
-            return await self.async_step_init()
 
         if user_input is not None:
             device_type = user_input[CONF_DEVICE_TYPE]
             await coordinator.async_update_device_type(
-                self._selected_device_id, device_type
+                device.id, device_type
             )
             # If not generic, proceed to entity configuration
             if device_type == DEVICE_TYPE_LIGHT:
@@ -550,37 +681,28 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             step_id="configure_device_type",
             data_schema=schema,
             errors=errors,
-            description_placeholders={"device_name": device.name},
+            description_placeholders=self._device_placeholders,
         )
 
+    @_requires_device
     async def async_step_configure_light(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None,
+        device: VirtualDevice,
+        coordinator: IRDeviceCoordinator,
     ) -> ConfigFlowResult:
         """Configure light entity command mappings."""
         errors: dict[str, str] = {}
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
-
-        if device is None:
-            return await self.async_step_init()
-
-        # Get list of available commands for selection
-        commands = {"": "(Not configured)"}
-        commands.update({cmd.name: cmd.name for cmd in device.commands.values()})
-
         light_config = device.entity_configs.get("light")
-        current_mappings = light_config.command_mappings if light_config else {}
-        current_options = light_config.options if light_config else {}
 
         if user_input is not None:
             # Build command mappings from user input
             mappings: dict[str, Any] = {}
 
             # Power commands
-            if user_input.get("turn_on"):
-                mappings["turn_on"] = user_input["turn_on"]
-            if user_input.get("turn_off"):
-                mappings["turn_off"] = user_input["turn_off"]
+            for key in ("turn_on", "turn_off"):
+                if value := user_input.get(key):
+                    mappings[key] = value
 
             # Brightness - use helper for discrete/relative parsing
             brightness_mode = user_input.get("brightness_mode", BRIGHTNESS_MODE_NONE)
@@ -597,11 +719,8 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             ))
 
             # Effects (nightlight)
-            effects: dict[str, str] = {}
-            if user_input.get("effect_nightlight"):
-                effects["Nightlight"] = user_input["effect_nightlight"]
-            if effects:
-                mappings["effects"] = effects
+            if nightlight := user_input.get("effect_nightlight"):
+                mappings["effects"] = {"Nightlight": nightlight}
 
             # Create or update config
             config = EntityConfig(
@@ -616,88 +735,82 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             )
 
             await coordinator.async_update_entity_config(
-                self._selected_device_id, "light", config
+                device.id, "light", config
             )
 
             return await self.async_step_device_menu()
 
+        # Get list of available commands for selection
+        commands = {"": "(Not configured)"}
+        commands.update({cmd.name: cmd.name for cmd in device.commands.values()})
+
         # Build form with current values
-        current_brightness_levels = current_mappings.get("brightness_levels", [])
-        current_color_temp_levels = current_mappings.get("color_temp_levels", [])
-        current_effects = current_mappings.get("effects", {})
+        current_mappings = light_config.command_mappings if light_config else {}
+        current_options = light_config.options if light_config else {}
+        cm_get = current_mappings.get
+        co_get = current_options.get
+        current_effects = cm_get("effects", {})
+        command_choice = vol.In(commands)
 
         schema = vol.Schema({
-            vol.Optional("turn_on", default=current_mappings.get("turn_on", "")): vol.In(commands),
-            vol.Optional("turn_off", default=current_mappings.get("turn_off", "")): vol.In(commands),
-            vol.Optional("brightness_mode", default=current_options.get("brightness_mode", BRIGHTNESS_MODE_NONE)): vol.In({
-                BRIGHTNESS_MODE_NONE: "No brightness control",
-                BRIGHTNESS_MODE_DISCRETE: "Discrete levels",
-                BRIGHTNESS_MODE_RELATIVE: "Up/Down buttons",
-                BRIGHTNESS_MODE_BOTH: "Both",
-            }),
-            vol.Optional("brightness_levels", default=",".join(current_brightness_levels)): str,
-            vol.Optional("brightness_up", default=current_mappings.get("brightness_up", "")): vol.In(commands),
-            vol.Optional("brightness_down", default=current_mappings.get("brightness_down", "")): vol.In(commands),
-            vol.Optional("color_temp_mode", default=current_options.get("color_temp_mode", BRIGHTNESS_MODE_NONE)): vol.In({
-                BRIGHTNESS_MODE_NONE: "No color temp control",
-                BRIGHTNESS_MODE_DISCRETE: "Discrete presets (cool to warm)",
-                BRIGHTNESS_MODE_RELATIVE: "Warmer/Cooler buttons",
-                BRIGHTNESS_MODE_BOTH: "Both",
-            }),
-            vol.Optional("color_temp_levels", default=",".join(current_color_temp_levels)): str,
-            vol.Optional("color_temp_up", default=current_mappings.get("color_temp_up", "")): vol.In(commands),
-            vol.Optional("color_temp_down", default=current_mappings.get("color_temp_down", "")): vol.In(commands),
-            vol.Optional("effect_nightlight", default=current_effects.get("Nightlight", "")): vol.In(commands),
+            vol.Optional("turn_on", default=cm_get("turn_on", "")): command_choice,
+            vol.Optional("turn_off", default=cm_get("turn_off", "")): command_choice,
+            vol.Optional("brightness_mode", default=co_get("brightness_mode", BRIGHTNESS_MODE_NONE)): vol.In(_BRIGHTNESS_MODE_LABELS),
+            vol.Optional("brightness_levels", default=",".join(cm_get("brightness_levels", []))): str,
+            vol.Optional("brightness_up", default=cm_get("brightness_up", "")): command_choice,
+            vol.Optional("brightness_down", default=cm_get("brightness_down", "")): command_choice,
+            vol.Optional("color_temp_mode", default=co_get("color_temp_mode", BRIGHTNESS_MODE_NONE)): vol.In(_COLOR_TEMP_MODE_LABELS),
+            vol.Optional("color_temp_levels", default=",".join(cm_get("color_temp_levels", []))): str,
+            vol.Optional("color_temp_up", default=cm_get("color_temp_up", "")): command_choice,
+            vol.Optional("color_temp_down", default=cm_get("color_temp_down", "")): command_choice,
+            vol.Optional("effect_nightlight", default=current_effects.get("Nightlight", "")): command_choice,
         })
 
         return self.async_show_form(
             step_id="configure_light",
             data_schema=schema,
             errors=errors,
-            description_placeholders={"device_name": device.name},
+            description_placeholders=self._device_placeholders,
         )
 
+    @_requires_device
     async def async_step_configure_cover(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None,
+        device: VirtualDevice,
+        coordinator: IRDeviceCoordinator,
     ) -> ConfigFlowResult:
         """Configure cover entity command mappings."""
         errors: dict[str, str] = {}
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
-
-        if device is None:
-            return await self.async_step_init()
-
-        # Get list of available commands for selection
-        commands = {"": "(Not configured)"}
-        commands.update({cmd.name: cmd.name for cmd in device.commands.values()})
-
-        cover_config = device.entity_configs.get("cover")
-        current_mappings = cover_config.command_mappings if cover_config else {}
 
         if user_input is not None:
             mappings: dict[str, str] = {}
-            if user_input.get("open"):
-                mappings["open"] = user_input["open"]
-            if user_input.get("close"):
-                mappings["close"] = user_input["close"]
-            if user_input.get("stop"):
-                mappings["stop"] = user_input["stop"]
+            for key in ("open", "close", "stop"):
+                if value := user_input.get(key):
+                    mappings[key] = value
 
+            cover_config = device.entity_configs.get("cover")
             config = EntityConfig(
                 entity_type="cover",
                 enabled=True,
                 command_mappings=mappings,
-                state={"position": 50},
+                state=cover_config.state if cover_config else {"position": 50},
                 options={"device_class": "shade"},
             )
 
             await coordinator.async_update_entity_config(
-                self._selected_device_id, "cover", config
+                device.id, "cover", config
             )
 
             return await self.async_step_device_menu()
 
+        # Get list of available commands for selection
+        commands = {"": "(Not configured)"}
+        commands.update({cmd.name: cmd.name for cmd in device.commands.values()})
+
+        cover_config = device.entity_configs.get("cover")
+        current_mappings = cover_config.command_mappings if cover_config else {}
+
         schema = vol.Schema({
             vol.Optional("open", default=current_mappings.get("open", "")): vol.In(commands),
             vol.Optional("close", default=current_mappings.get("close", "")): vol.In(commands),
@@ -708,39 +821,35 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             step_id="configure_cover",
             data_schema=schema,
             errors=errors,
-            description_placeholders={"device_name": device.name},
+            description_placeholders=self._device_placeholders,
         )
 
+    @_requires_device
     async def async_step_delete_command(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None,
+        device: VirtualDevice,
+        coordinator: IRDeviceCoordinator,
     ) -> ConfigFlowResult:
         """Handle deleting a command."""
         errors: dict[str, str] = {}
-        coordinator = self._get_coordinator()
-        device = coordinator.get_device(self._selected_device_id)
-
-        if device is None:
-            return await self.async_step_init()
 
-        commands = {
-            cmd.name: f"{cmd.name} ({cmd.command_type.upper()})"
-            for cmd in device.commands.values()
-        }
+        commands = device.command_choices
 
         if not commands:
             errors["base"] = "no_commands"
             return self.async_show_form(
                 step_id="delete_command",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors=errors,
-                description_placeholders={"device_name": device.name},
+                description_placeholders=self._device_placeholders,
             )
 
         if user_input is not None:
             command_name = user_input[CONF_COMMAND_NAME]
             try:
                 await coordinator.async_delete_command(
-                    self._selected_device_id,
+                    device.id,
                     command_name,
                 )
                 return self.async_create_entry(title="", data={})
@@ -761,7 +870,7 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
             step_id="delete_command",
             data_schema=schema,
             errors=errors,
-            description_placeholders={"device_name": device.name},
+            description_placeholders=self._device_placeholders,
         )
 
     async def async_step_delete_device(
@@ -771,16 +880,13 @@ class RemoteIRDeviceManagerOptionsFlow(OptionsFlow):
         errors: dict[str, str] = {}
         coordinator = self._get_coordinator()
 
-        devices = {
-            device.id: f"{device.name} ({len(device.commands)} commands)"
-            for device in coordinator.devices.values()
-        }
+        devices = coordinator.device_delete_labels
 
         if not devices:
             errors["base"] = "no_devices"
             return self.async_show_form(
                 step_id="delete_device",
-                data_schema=vol.Schema({}),
+                data_schema=_EMPTY_SCHEMA,
                 errors=errors,
             )
 
@@ -1,5 +1,6 @@
 """Constants for the Remote IR Device Manager integration."""
 
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "remote_ir_device_manager"
@@ -25,12 +26,14 @@ DEVICE_TYPE_LIGHT: Final = "light"
 DEVICE_TYPE_COVER: Final = "cover"
 DEVICE_TYPE_FAN: Final = "fan"
 
-DEVICE_TYPES: Final = {
-    DEVICE_TYPE_GENERIC: "Generic (buttons only)",
-    DEVICE_TYPE_LIGHT: "Light",
-    DEVICE_TYPE_COVER: "Cover (blinds, projector screen)",
-    DEVICE_TYPE_FAN: "Fan",
-}
+DEVICE_TYPES: Final = MappingProxyType(
+    {
+        DEVICE_TYPE_GENERIC: "Generic (buttons only)",
+        DEVICE_TYPE_LIGHT: "Light",
+        DEVICE_TYPE_COVER: "Cover (blinds, projector screen)",
+        DEVICE_TYPE_FAN: "Fan",
+    }
+)
 
 # Light-specific constants
 BRIGHTNESS_MODE_NONE: Final = "none"
@@ -38,7 +41,8 @@ BRIGHTNESS_MODE_DISCRETE: Final = "discrete"
 BRIGHTNESS_MODE_RELATIVE: Final = "relative"
 BRIGHTNESS_MODE_BOTH: Final = "both"
 
-COLOR_TEMP_PRESETS: Final = ["cool", "daylight", "neutral", "warm_white", "warm"]
+# Ordered cool to warm
+COLOR_TEMP_PRESETS: Final = ("cool", "daylight", "neutral", "warm_white", "warm")
 
 # Defaults
 DEFAULT_LEARN_TIMEOUT: Final = 30
@@ -46,6 +50,13 @@ DEFAULT_LEARN_TIMEOUT: Final = 30
 # Platforms
 PLATFORMS: Final = ["button", "remote", "light", "cover"]
 
+# Dispatcher signals, formatted with a device ID / config entry ID
+SIGNAL_DEVICE_UPDATED: Final = f"{DOMAIN}_device_updated_{{}}"
+SIGNAL_COMMAND_ADDED: Final = f"{DOMAIN}_command_added_{{}}"
+
+# hass.data keys
+DATA_DEVICE_INDEX: Final = "_device_index"
+
 # Storage
 STORAGE_VERSION: Final = 2
 STORAGE_KEY: Final = DOMAIN
@@ -2,21 +2,45 @@
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import binascii
+from collections.abc import Iterable, Mapping
 import logging
+from types import MappingProxyType
 import uuid
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .adapters import AdapterRegistry
-from .const import DEVICE_TYPE_LIGHT, DEVICE_TYPE_COVER, DEVICE_TYPE_FAN
+from .const import (
+    DATA_DEVICE_INDEX,
+    DEVICE_TYPE_COVER,
+    DEVICE_TYPE_FAN,
+    DEVICE_TYPE_LIGHT,
+    DOMAIN,
+    SIGNAL_COMMAND_ADDED,
+    SIGNAL_DEVICE_UPDATED,
+)
 from .storage import IRCommand, IRDeviceStorage, VirtualDevice, EntityConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+# IRCommand fields async_update_command may change. The name is the
+# command's key on the device, so renaming isn't an in-place update.
+_UPDATABLE_COMMAND_FIELDS = frozenset({"code", "command_type", "icon"})
+
+
+class LearnTimeoutError(HomeAssistantError):
+    """Error raised when the IR blaster received no code while learning."""
+
+
+class InvalidIRCodeError(HomeAssistantError):
+    """Error raised when an IR code is not valid base64."""
+
 
 class IRDeviceCoordinator:
     """Coordinator for managing virtual IR devices and commands."""
@@ -28,6 +52,15 @@ class IRDeviceCoordinator:
         self._storage = IRDeviceStorage(hass, entry.entry_id)
         self._adapter_registry = AdapterRegistry(hass)
         self._last_sent_command: dict[str, str] = {}
+        self._async_call_service = hass.services.async_call
+        self._unloaded = False
+        # Options flow dropdowns, rebuilt lazily after devices change
+        self._device_choices: Mapping[str, str] | None = None
+        self._device_delete_labels: Mapping[str, str] | None = None
+        # Shared across entries so services can find a device's coordinator
+        self._device_index: dict[str, IRDeviceCoordinator] = hass.data.setdefault(
+            DOMAIN, {}
+        ).setdefault(DATA_DEVICE_INDEX, {})
 
     @property
     def hass(self) -> HomeAssistant:
@@ -39,11 +72,51 @@ class IRDeviceCoordinator:
         """Return config entry."""
         return self._entry
 
+    @property
+    def unloaded(self) -> bool:
+        """Return True once the config entry owning this coordinator unloaded."""
+        return self._unloaded
+
     @property
     def devices(self) -> dict[str, VirtualDevice]:
         """Return all virtual devices."""
         return self._storage.devices
 
+    @property
+    def device_names(self) -> Mapping[str, str]:
+        """Return device IDs keyed by lowercased device name."""
+        return self._storage.device_names
+
+    @property
+    def device_choices(self) -> Mapping[str, str]:
+        """Return device names keyed by device ID, sorted by name."""
+        if self._device_choices is None:
+            self._device_choices = MappingProxyType(
+                {device.id: device.name for device in self._sorted_devices()}
+            )
+        return self._device_choices
+
+    @property
+    def device_delete_labels(self) -> Mapping[str, str]:
+        """Return device labels with command counts keyed by device ID."""
+        if self._device_delete_labels is None:
+            self._device_delete_labels = MappingProxyType(
+                {
+                    device.id: f"{device.name} ({len(device.commands)} commands)"
+                    for device in self._sorted_devices()
+                }
+            )
+        return self._device_delete_labels
+
+    def _sorted_devices(self) -> list[VirtualDevice]:
+        """Return devices ordered by name for display."""
+        return sorted(self.devices.values(), key=lambda device: device.name.lower())
+
+    def _invalidate_device_choices(self) -> None:
+        """Drop cached device dropdowns after devices or commands change."""
+        self._device_choices = None
+        self._device_delete_labels = None
+
     @property
     def last_sent_command(self) -> dict[str, str]:
         """Return last sent command per device."""
@@ -51,7 +124,7 @@ class IRDeviceCoordinator:
 
     def get_device(self, device_id: str) -> VirtualDevice | None:
         """Get a virtual device by ID."""
-        return self._storage.get_device(device_id)
+        return self._storage.devices.get(device_id)
 
     def get_device_by_name(self, name: str) -> VirtualDevice | None:
         """Get a virtual device by name."""
@@ -65,11 +138,25 @@ class IRDeviceCoordinator:
         device = self._storage.get_device(device_id)
         if device is None:
             return False
-        return command_name.lower() in device.commands
+        return device.has_command(command_name)
 
     async def async_load(self) -> None:
         """Load data from storage."""
         await self._storage.async_load()
+        for device_id in self._storage.devices:
+            self._device_index[device_id] = self
+
+    async def async_flush(self) -> None:
+        """Write out any pending storage changes."""
+        await self._storage.async_flush()
+
+    @callback
+    def async_unload(self) -> None:
+        """Release listeners held by the coordinator."""
+        self._unloaded = True
+        self._adapter_registry.async_unload()
+        for device_id in self._storage.devices:
+            self._device_index.pop(device_id, None)
 
     async def async_add_device(
         self, name: str, ir_blaster_entity_id: str
@@ -85,10 +172,12 @@ class IRDeviceCoordinator:
             ir_blaster_entity_id=ir_blaster_entity_id,
         )
         await self._storage.async_add_device(device)
+        self._device_index[device.id] = self
+        self._invalidate_device_choices()
         _LOGGER.info("Added virtual device: %s", name)
 
         # Reload to create the new remote entity
-        await self._async_reload_entry()
+        self._async_reload_entry()
 
         return device
 
@@ -96,9 +185,11 @@ class IRDeviceCoordinator:
         """Remove a virtual device."""
         result = await self._storage.async_remove_device(device_id)
         if result:
+            self._device_index.pop(device_id, None)
+            self._invalidate_device_choices()
             _LOGGER.info("Removed virtual device: %s", device_id)
             # Reload to remove the orphaned entities
-            await self._async_reload_entry()
+            self._async_reload_entry()
         return result
 
     async def async_add_command(
@@ -115,7 +206,7 @@ class IRDeviceCoordinator:
             raise HomeAssistantError(f"Device '{device_id}' not found")
 
         # Check for duplicate command names
-        if command_name.lower() in device.commands:
+        if device.has_command(command_name):
             raise HomeAssistantError(
                 f"Command '{command_name}' already exists on device '{device.name}'"
             )
@@ -126,9 +217,9 @@ class IRDeviceCoordinator:
 
         # Validate base64 encoding
         try:
-            base64.b64decode(code, validate=True)
-        except Exception as err:
-            raise HomeAssistantError(f"Invalid base64 code: {err}") from err
+            binascii.a2b_base64(code, strict_mode=True)
+        except (binascii.Error, ValueError) as err:
+            raise InvalidIRCodeError(f"Invalid base64 code: {err}") from err
 
         command = IRCommand(
             id=str(uuid.uuid4()),
@@ -139,10 +230,17 @@ class IRDeviceCoordinator:
         )
 
         await self._storage.async_add_command(device_id, command)
+        self._invalidate_device_choices()
         _LOGGER.info("Added command '%s' to device '%s'", command_name, device.name)
 
-        # Trigger entity refresh
-        await self._async_reload_entry()
+        # Add the command's button and refresh the device's entities
+        async_dispatcher_send(
+            self._hass,
+            SIGNAL_COMMAND_ADDED.format(self._entry.entry_id),
+            device,
+            command,
+        )
+        self._async_device_updated(device_id)
 
         return command
 
@@ -152,15 +250,16 @@ class IRDeviceCoordinator:
         """Delete a command from a device."""
         result = await self._storage.async_remove_command(device_id, command_name)
         if result:
+            self._invalidate_device_choices()
             _LOGGER.info("Deleted command '%s' from device '%s'", command_name, device_id)
-            await self._async_reload_entry()
+            self._async_device_updated(device_id)
         return result
 
     async def async_send_command(
         self, device_id: str, command_name: str, num_repeats: int = 1
     ) -> None:
         """Send a command via the IR blaster."""
-        device = self._storage.get_device(device_id)
+        device = self._storage.devices.get(device_id)
         if device is None:
             raise HomeAssistantError(f"Device '{device_id}' not found")
 
@@ -170,16 +269,15 @@ class IRDeviceCoordinator:
                 f"Command '{command_name}' not found on device '{device.name}'"
             )
 
-        # Send command via remote.send_command
+        # Send command via remote.send_command, repeating it ourselves so
+        # repeats don't depend on the blaster honouring num_repeats
+        service_data = {
+            "entity_id": device.ir_blaster_entity_id,
+            "command": f"b64:{command.code}",
+        }
         for _ in range(num_repeats):
-            await self._hass.services.async_call(
-                "remote",
-                "send_command",
-                {
-                    "entity_id": device.ir_blaster_entity_id,
-                    "command": f"b64:{command.code}",
-                },
-                blocking=True,
+            await self._async_call_service(
+                "remote", "send_command", service_data, blocking=True
             )
 
         self._last_sent_command[device_id] = command_name
@@ -190,6 +288,19 @@ class IRDeviceCoordinator:
             device.ir_blaster_entity_id,
         )
 
+    async def async_send_commands(
+        self,
+        device_id: str,
+        command_names: Iterable[str],
+        num_repeats: int = 1,
+        delay_secs: float = 0,
+    ) -> None:
+        """Send a sequence of commands, waiting delay_secs between them."""
+        for index, command_name in enumerate(command_names):
+            if index and delay_secs > 0:
+                await asyncio.sleep(delay_secs)
+            await self.async_send_command(device_id, command_name, num_repeats)
+
     async def async_learn_command(
         self,
         device_id: str,
@@ -203,16 +314,92 @@ class IRDeviceCoordinator:
         retrieve the learned code. If automatic retrieval fails,
         returns None (user must input code manually).
         """
-        device = self._storage.get_device(device_id)
+        device = self._get_device_for_learning(device_id, command_name)
+        temp_names = await self._async_learn_code(
+            device, command_name, command_type, timeout
+        )
+
+        # Attempt to retrieve the learned code
+        code = await self._adapter_registry.retrieve_learned_code(
+            device.ir_blaster_entity_id, *temp_names
+        )
+        return await self._async_store_learned_code(
+            device_id, command_name, code, command_type
+        )
+
+    async def async_learn_commands(
+        self,
+        device_id: str,
+        command_names: Iterable[str],
+        command_type: str = "ir",
+        timeout: int = 30,
+    ) -> dict[str, IRCommand | None]:
+        """Learn several IR commands in a row.
+
+        All commands are learned first and their codes retrieved from the
+        blaster in one batch. Commands that fail to learn are logged and
+        left out of the result; None marks a code that must be entered
+        manually.
+        """
+        device = self.get_device(device_id)
+        if device is None:
+            raise HomeAssistantError(f"Device '{device_id}' not found")
+
+        learned: dict[str, tuple[str, str]] = {}
+        for command_name in command_names:
+            if command_name in learned:
+                continue
+            try:
+                self._get_device_for_learning(device_id, command_name)
+                learned[command_name] = await self._async_learn_code(
+                    device, command_name, command_type, timeout
+                )
+            except HomeAssistantError as err:
+                _LOGGER.error("Failed to learn command '%s': %s", command_name, err)
+
+        if not learned:
+            return {}
+
+        codes = await self._adapter_registry.retrieve_many(
+            device.ir_blaster_entity_id, learned.values()
+        )
+        results: dict[str, IRCommand | None] = {}
+        for command_name, temp_names in learned.items():
+            try:
+                results[command_name] = await self._async_store_learned_code(
+                    device_id, command_name, codes[temp_names], command_type
+                )
+            except HomeAssistantError as err:
+                _LOGGER.error("Failed to store command '%s': %s", command_name, err)
+        return results
+
+    def _get_device_for_learning(
+        self, device_id: str, command_name: str
+    ) -> VirtualDevice:
+        """Return the device a new command will be learned on."""
+        device = self.get_device(device_id)
         if device is None:
             raise HomeAssistantError(f"Device '{device_id}' not found")
 
         # Check for duplicate command names
-        if command_name.lower() in device.commands:
+        if device.has_command(command_name):
             raise HomeAssistantError(
                 f"Command '{command_name}' already exists on device '{device.name}'"
             )
+        return device
 
+    async def _async_learn_code(
+        self,
+        device: VirtualDevice,
+        command_name: str,
+        command_type: str,
+        timeout: int,
+    ) -> tuple[str, str]:
+        """Put the IR blaster in learning mode for one command.
+
+        Returns the temporary (device, command) names the blaster stored
+        the code under.
+        """
         # Create temporary device/command names for learning
         temp_device = f"_ridm_{device.id[:8]}"
         temp_command = f"_temp_{command_name}"
@@ -225,7 +412,7 @@ class IRDeviceCoordinator:
 
         try:
             # Call the underlying remote.learn_command
-            await self._hass.services.async_call(
+            await self._async_call_service(
                 "remote",
                 "learn_command",
                 {
@@ -237,17 +424,23 @@ class IRDeviceCoordinator:
                 },
                 blocking=True,
             )
+        except TimeoutError as err:
+            _LOGGER.error("Learning timed out: %s", err)
+            raise LearnTimeoutError(f"Learning timed out: {err}") from err
         except Exception as err:
             _LOGGER.error("Learning failed: %s", err)
             raise HomeAssistantError(f"Learning failed: {err}") from err
 
-        # Attempt to retrieve the learned code
-        code = await self._adapter_registry.retrieve_learned_code(
-            device.ir_blaster_entity_id,
-            temp_device,
-            temp_command,
-        )
+        return temp_device, temp_command
 
+    async def _async_store_learned_code(
+        self,
+        device_id: str,
+        command_name: str,
+        code: str | None,
+        command_type: str,
+    ) -> IRCommand | None:
+        """Store a retrieved code as a new command."""
         if code:
             # Successfully retrieved code - store it
             command = await self.async_add_command(
@@ -276,12 +469,23 @@ class IRDeviceCoordinator:
         if command is None:
             return False
 
+        changed = False
         for key, value in updates.items():
-            if hasattr(command, key):
-                setattr(command, key, value)
-
-        await self._storage.async_save()
-        await self._async_reload_entry()
+            if key not in _UPDATABLE_COMMAND_FIELDS:
+                _LOGGER.warning("Ignoring update of command field '%s'", key)
+                continue
+            if getattr(command, key) == value:
+                continue
+            setattr(command, key, value)
+            changed = True
+
+        # Re-submitted forms often carry the current values
+        if not changed:
+            return True
+
+        device.invalidate_command_cache()
+        self._storage.async_schedule_save()
+        self._async_device_updated(device_id)
         return True
 
     async def async_update_device_type(
@@ -322,7 +526,7 @@ class IRDeviceCoordinator:
 
         await self._storage.async_save()
         _LOGGER.info("Updated device '%s' type to '%s'", device.name, device_type)
-        await self._async_reload_entry()
+        self._async_reload_entry()
         return True
 
     async def async_update_entity_config(
@@ -333,26 +537,42 @@ class IRDeviceCoordinator:
         if device is None:
             return False
 
+        previous = device.entity_configs.get(entity_type)
         device.entity_configs[entity_type] = config
-        await self._storage.async_save()
         _LOGGER.info(
             "Updated %s config for device '%s'", entity_type, device.name
         )
-        await self._async_reload_entry()
+        if previous is None or previous.enabled != config.enabled:
+            # The entity is created or removed, so the platforms must rerun
+            await self._storage.async_save()
+            self._async_reload_entry()
+        else:
+            self._storage.async_schedule_save()
+            self._async_device_updated(device_id)
         return True
 
-    async def async_save_entity_state(
+    @callback
+    def async_save_entity_state(
         self, device_id: str, entity_type: str, state: dict[str, Any]
     ) -> None:
-        """Save entity state to storage (for assumed state persistence)."""
+        """Schedule saving entity state (for assumed state persistence)."""
         device = self._storage.get_device(device_id)
         if device and entity_type in device.entity_configs:
             device.entity_configs[entity_type].state = state
-            await self._storage.async_save()
+            self._storage.async_schedule_save()
 
-    async def _async_reload_entry(self) -> None:
-        """Reload the config entry to refresh entities."""
-        try:
-            await self._hass.config_entries.async_reload(self._entry.entry_id)
-        except Exception as err:
-            _LOGGER.warning("Failed to reload config entry: %s", err)
+    @callback
+    def _async_device_updated(self, device_id: str) -> None:
+        """Tell a device's entities to refresh from the changed device."""
+        async_dispatcher_send(self._hass, SIGNAL_DEVICE_UPDATED.format(device_id))
+
+    @callback
+    def _async_reload_entry(self) -> None:
+        """Schedule a reload of the config entry to recreate entities.
+
+        The caller doesn't wait for platforms to tear down and set up again;
+        reload failures are logged by Home Assistant.
+        """
+        self._hass.async_create_task(
+            self._hass.config_entries.async_reload(self._entry.entry_id)
+        )
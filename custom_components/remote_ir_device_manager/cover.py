@@ -24,6 +24,13 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Command mapping key -> feature it enables
+_FEATURE_MAP = (
+    ("open", CoverEntityFeature.OPEN),
+    ("close", CoverEntityFeature.CLOSE),
+    ("stop", CoverEntityFeature.STOP),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -79,10 +86,6 @@ class IRCover(IRDeviceEntityMixin, CoverEntity):
         self._attr_unique_id = f"{entry.entry_id}_{virtual_device.id}_cover"
         self._attr_name = None  # Use device name
 
-        # Device class - default to shade, can be configured
-        device_class = config.options.get("device_class", "shade")
-        self._attr_device_class = CoverDeviceClass(device_class)
-
         # Device info - same identifier as other entities for grouping
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{entry.entry_id}_{virtual_device.id}")},
@@ -95,17 +98,27 @@ class IRCover(IRDeviceEntityMixin, CoverEntity):
         # Configure supported features based on command mappings
         self._setup_features()
 
+    def _handle_device_update(self) -> None:
+        """Pick up a cover config replaced from the options flow."""
+        config = self._virtual_device.entity_configs.get("cover")
+        if config is None or config is self._config:
+            return
+        self._config = config
+        self._is_closed = config.state.get("is_closed")
+        self._position = config.state.get("position", 50)
+        self._setup_features()
+
     def _setup_features(self) -> None:
         """Configure supported features based on available commands."""
-        mappings = self._config.command_mappings
-        features = CoverEntityFeature(0)
+        # Device class - default to shade, can be configured
+        device_class = self._config.options.get("device_class", "shade")
+        self._attr_device_class = CoverDeviceClass(device_class)
 
-        if mappings.get("open"):
-            features |= CoverEntityFeature.OPEN
-        if mappings.get("close"):
-            features |= CoverEntityFeature.CLOSE
-        if mappings.get("stop"):
-            features |= CoverEntityFeature.STOP
+        mappings_get = self._config.command_mappings.get
+        features = CoverEntityFeature(0)
+        for key, feature in _FEATURE_MAP:
+            if mappings_get(key):
+                features |= feature
 
         self._attr_supported_features = features
 
@@ -121,33 +134,27 @@ class IRCover(IRDeviceEntityMixin, CoverEntity):
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
-        mappings = self._config.command_mappings
-        cmd = mappings.get("open")
-        if cmd:
+        if cmd := self._config.command_mappings.get("open"):
             await self._send_ir_command(cmd)
 
         self._is_closed = False
         self._position = 100
-        await self._save_state()
         self.async_write_ha_state()
+        self._save_state()
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
-        mappings = self._config.command_mappings
-        cmd = mappings.get("close")
-        if cmd:
+        if cmd := self._config.command_mappings.get("close"):
             await self._send_ir_command(cmd)
 
         self._is_closed = True
         self._position = 0
-        await self._save_state()
         self.async_write_ha_state()
+        self._save_state()
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
-        mappings = self._config.command_mappings
-        cmd = mappings.get("stop")
-        if cmd:
+        if cmd := self._config.command_mappings.get("stop"):
             await self._send_ir_command(cmd)
 
         # Position stays at assumed current position
@@ -155,13 +162,21 @@ class IRCover(IRDeviceEntityMixin, CoverEntity):
         if self._position in (0, 100):
             self._position = 50
             self._is_closed = None  # Unknown
-        await self._save_state()
         self.async_write_ha_state()
-
-    async def _save_state(self) -> None:
-        """Persist assumed state to storage."""
-        self._config.state["is_closed"] = self._is_closed
-        self._config.state["position"] = self._position
-        await self._coordinator.async_save_entity_state(
-            self._virtual_device.id, "cover", self._config.state
+        self._save_state()
+
+    def _save_state(self) -> None:
+        """Schedule persisting the assumed state to storage."""
+        state = self._config.state
+        # Repeating a command on an already open/closed cover changes nothing
+        if (
+            state.get("position") == self._position
+            and "is_closed" in state
+            and state["is_closed"] == self._is_closed
+        ):
+            return
+        state["is_closed"] = self._is_closed
+        state["position"] = self._position
+        self._coordinator.async_save_entity_state(
+            self._virtual_device.id, "cover", state
         )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -27,6 +28,34 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Color temperature range mapped onto discrete presets, cool to warm
+MIN_KELVIN = 2000
+MAX_KELVIN = 6500
+DEFAULT_KELVIN = 4000
+
+
+@lru_cache(maxsize=16)
+def _brightness_index_table(num_levels: int) -> tuple[int, ...]:
+    """Return the discrete level index for each brightness value 0-255."""
+    last = num_levels - 1
+    return tuple(
+        max(0, min(round((brightness - 1) / 254 * last), last))
+        for brightness in range(256)
+    )
+
+
+@lru_cache(maxsize=16)
+def _kelvin_table(num_levels: int) -> tuple[int, ...]:
+    """Return the Kelvin value of each color temp preset index."""
+    if num_levels == 1:
+        return (DEFAULT_KELVIN,)
+    # Index 0 = 6500K (cool), last index = 2000K (warm)
+    kelvin_range = MAX_KELVIN - MIN_KELVIN
+    return tuple(
+        int(MAX_KELVIN - (index / (num_levels - 1)) * kelvin_range)
+        for index in range(num_levels)
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -79,6 +108,7 @@ class IRLight(IRDeviceEntityMixin, LightEntity):
         self._brightness: int = config.state.get("brightness", 255)
         self._color_temp_index: int = config.state.get("color_temp_index", 2)  # Default neutral
         self._effect: str | None = config.state.get("effect")
+        self._last_saved_state = self._assumed_state()
 
         # Unique ID
         self._attr_unique_id = f"{entry.entry_id}_{virtual_device.id}_light"
@@ -96,6 +126,19 @@ class IRLight(IRDeviceEntityMixin, LightEntity):
         # Configure supported features based on command mappings
         self._setup_features()
 
+    def _handle_device_update(self) -> None:
+        """Pick up a light config replaced from the options flow."""
+        config = self._virtual_device.entity_configs.get("light")
+        if config is None or config is self._config:
+            return
+        self._config = config
+        self._is_on = config.state.get("is_on", False)
+        self._brightness = config.state.get("brightness", 255)
+        self._color_temp_index = config.state.get("color_temp_index", 2)
+        self._effect = config.state.get("effect")
+        self._last_saved_state = self._assumed_state()
+        self._setup_features()
+
     def _setup_features(self) -> None:
         """Configure supported features based on available commands."""
         mappings = self._config.command_mappings
@@ -126,17 +169,46 @@ class IRLight(IRDeviceEntityMixin, LightEntity):
             self._attr_color_mode = ColorMode.COLOR_TEMP
             # Set min/max color temp in mireds
             # 153 mireds = ~6500K (cool), 500 mireds = ~2000K (warm)
-            self._attr_min_color_temp_kelvin = 2000
-            self._attr_max_color_temp_kelvin = 6500
+            self._attr_min_color_temp_kelvin = MIN_KELVIN
+            self._attr_max_color_temp_kelvin = MAX_KELVIN
 
         self._attr_supported_color_modes = supported_color_modes
 
+        # Commands and options used by the service handlers, bound once
+        # per config so calls don't repeat the mapping lookups
+        toggle = mappings.get("toggle")
+        self._cmd_turn_on: str | None = mappings.get("turn_on") or toggle
+        self._cmd_turn_off: str | None = mappings.get("turn_off") or toggle
+        self._brightness_mode: str = brightness_mode
+        self._brightness_levels: list[str] = mappings.get("brightness_levels") or []
+        self._cmd_brightness_up: str | None = mappings.get("brightness_up")
+        self._cmd_brightness_down: str | None = mappings.get("brightness_down")
+        self._brightness_step_size: int = options.get("brightness_step_size", 25)
+        self._color_temp_levels: list[str] = mappings.get("color_temp_levels") or []
+        self._cmd_color_temp_up: str | None = mappings.get("color_temp_up")
+        self._cmd_color_temp_down: str | None = mappings.get("color_temp_down")
+        self._effects: dict[str, str] = mappings.get("effects") or {}
+
+        # Level lookup tables, shared between lights with the same level count
+        self._brightness_index: tuple[int, ...] | None = (
+            _brightness_index_table(len(self._brightness_levels))
+            if self._brightness_levels
+            else None
+        )
+        self._kelvin_by_index: tuple[int, ...] | None = (
+            _kelvin_table(len(self._color_temp_levels))
+            if self._color_temp_levels
+            else None
+        )
+
         # Check for effect support
         features = LightEntityFeature(0)
-        effects = mappings.get("effects", {})
+        effects = self._effects
         if effects:
             features |= LightEntityFeature.EFFECT
             self._attr_effect_list = list(effects.keys())
+        else:
+            self._attr_effect_list = None
 
         self._attr_supported_features = features
 
@@ -166,12 +238,11 @@ class IRLight(IRDeviceEntityMixin, LightEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
-        mappings = self._config.command_mappings
+        previous = self._assumed_state()
 
         # If light is off, turn it on first
         if not self._is_on:
-            cmd = mappings.get("turn_on") or mappings.get("toggle")
-            if cmd:
+            if cmd := self._cmd_turn_on:
                 await self._send_ir_command(cmd)
             self._is_on = True
 
@@ -193,45 +264,37 @@ class IRLight(IRDeviceEntityMixin, LightEntity):
             await self._set_effect(effect_name)
             self._effect = effect_name
 
-        await self._save_state()
-        self.async_write_ha_state()
+        if self._assumed_state() != previous:
+            self.async_write_ha_state()
+            self._save_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
-        mappings = self._config.command_mappings
-        cmd = mappings.get("turn_off") or mappings.get("toggle")
-        if cmd:
+        if cmd := self._cmd_turn_off:
+            # Always send: the assumed state may not match the real light
             await self._send_ir_command(cmd)
 
-        self._is_on = False
-        self._effect = None
-        await self._save_state()
-        self.async_write_ha_state()
+        if self._is_on or self._effect is not None:
+            self._is_on = False
+            self._effect = None
+            self.async_write_ha_state()
+            self._save_state()
 
     async def _set_brightness(self, target_brightness: int) -> None:
         """Set brightness to target level (1-255)."""
-        mappings = self._config.command_mappings
-        options = self._config.options
-        brightness_mode = options.get("brightness_mode", "discrete")
-
-        levels = mappings.get("brightness_levels", [])
+        brightness_mode = self._brightness_mode
+        levels = self._brightness_levels
 
         if brightness_mode in ("discrete", "both") and levels:
-            # Map 1-255 to discrete levels
-            num_levels = len(levels)
-            # Calculate target level index (0-based)
-            target_index = round((target_brightness - 1) / 254 * (num_levels - 1))
-            target_index = max(0, min(target_index, num_levels - 1))
-
-            # Send the discrete level command
-            cmd = levels[target_index]
+            # Map 1-255 to discrete levels and send that level's command
+            cmd = levels[self._brightness_index[target_brightness]]
             await self._send_ir_command(cmd)
 
         elif brightness_mode == "relative":
             # Use up/down commands - this is approximate
-            up_cmd = mappings.get("brightness_up")
-            down_cmd = mappings.get("brightness_down")
-            step_size = options.get("brightness_step_size", 25)
+            up_cmd = self._cmd_brightness_up
+            down_cmd = self._cmd_brightness_down
+            step_size = self._brightness_step_size
 
             if up_cmd and down_cmd:
                 diff = target_brightness - self._brightness
@@ -246,16 +309,16 @@ class IRLight(IRDeviceEntityMixin, LightEntity):
 
     async def _set_color_temp_kelvin(self, target_kelvin: int) -> None:
         """Set color temperature."""
-        mappings = self._config.command_mappings
-        levels = mappings.get("color_temp_levels", [])
+        levels = self._color_temp_levels
+        up_cmd = self._cmd_color_temp_up
+        down_cmd = self._cmd_color_temp_down
 
         if levels:
             # Map Kelvin to discrete preset index
             num_levels = len(levels)
             # 6500K (cool) = index 0, 2000K (warm) = last index
-            kelvin_range = self._attr_max_color_temp_kelvin - self._attr_min_color_temp_kelvin
             # Invert because higher Kelvin = cooler = lower index
-            normalized = (self._attr_max_color_temp_kelvin - target_kelvin) / kelvin_range
+            normalized = (MAX_KELVIN - target_kelvin) / (MAX_KELVIN - MIN_KELVIN)
             target_index = round(normalized * (num_levels - 1))
             target_index = max(0, min(target_index, num_levels - 1))
 
@@ -263,7 +326,7 @@ class IRLight(IRDeviceEntityMixin, LightEntity):
             await self._send_ir_command(cmd)
             self._color_temp_index = target_index
 
-        elif mappings.get("color_temp_up") and mappings.get("color_temp_down"):
+        elif up_cmd and down_cmd:
             # Use relative adjustment (less precise)
             current_kelvin = self._index_to_kelvin(self._color_temp_index)
             diff = target_kelvin - current_kelvin
@@ -272,40 +335,43 @@ class IRLight(IRDeviceEntityMixin, LightEntity):
             steps = round(abs(diff) / step_size)
             if diff > 0:  # Cooler (higher Kelvin)
                 for _ in range(steps):
-                    await self._send_ir_command(mappings["color_temp_up"])
+                    await self._send_ir_command(up_cmd)
             elif diff < 0:  # Warmer (lower Kelvin)
                 for _ in range(steps):
-                    await self._send_ir_command(mappings["color_temp_down"])
+                    await self._send_ir_command(down_cmd)
 
     def _index_to_kelvin(self, index: int) -> int:
         """Convert color temp index to Kelvin."""
-        levels = self._config.command_mappings.get("color_temp_levels", [])
-        if not levels:
-            return 4000  # Default neutral
-
-        num_levels = len(levels)
-        if num_levels == 1:
-            return 4000
+        kelvin_by_index = self._kelvin_by_index
+        if not kelvin_by_index:
+            return DEFAULT_KELVIN  # Default neutral
 
-        # Index 0 = 6500K (cool), last index = 2000K (warm)
-        kelvin_range = self._attr_max_color_temp_kelvin - self._attr_min_color_temp_kelvin
-        return int(self._attr_max_color_temp_kelvin - (index / (num_levels - 1)) * kelvin_range)
+        # Stored indexes may predate a shorter preset list
+        return kelvin_by_index[max(0, min(index, len(kelvin_by_index) - 1))]
 
     async def _set_effect(self, effect_name: str) -> None:
         """Activate an effect."""
-        mappings = self._config.command_mappings
-        effects = mappings.get("effects", {})
-
-        if effect_name in effects:
-            cmd = effects[effect_name]
+        if cmd := self._effects.get(effect_name):
             await self._send_ir_command(cmd)
 
-    async def _save_state(self) -> None:
-        """Persist assumed state to storage."""
-        self._config.state["is_on"] = self._is_on
-        self._config.state["brightness"] = self._brightness
-        self._config.state["color_temp_index"] = self._color_temp_index
-        self._config.state["effect"] = self._effect
-        await self._coordinator.async_save_entity_state(
+    def _assumed_state(self) -> tuple[bool, int, int, str | None]:
+        """Return the assumed state fields that are persisted."""
+        return (self._is_on, self._brightness, self._color_temp_index, self._effect)
+
+    def _save_state(self) -> None:
+        """Schedule persisting the assumed state to storage."""
+        assumed_state = self._assumed_state()
+        if assumed_state == self._last_saved_state:
+            return
+        self._last_saved_state = assumed_state
+
+        is_on, brightness, color_temp_index, effect = assumed_state
+        self._config.state.update(
+            is_on=is_on,
+            brightness=brightness,
+            color_temp_index=color_temp_index,
+            effect=effect,
+        )
+        self._coordinator.async_save_entity_state(
             self._virtual_device.id, "light", self._config.state
         )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Iterable
 import logging
 from typing import TYPE_CHECKING, Any
@@ -82,30 +81,28 @@ class VirtualRemoteEntity(IRDeviceEntityMixin, RemoteEntity):
             sw_version="1.0",
         )
 
+        self._handle_device_update()
+
+    def _handle_device_update(self) -> None:
+        """Rebuild the command-derived attributes after commands change."""
+        commands = self._virtual_device.commands
+        self._attr_activity_list = [cmd.name for cmd in commands.values()]
+        self._attr_extra_state_attributes = {
+            "ir_blaster": self._virtual_device.ir_blaster_entity_id,
+            "command_count": len(commands),
+            "commands": list(commands),
+        }
+
     @property
     def is_on(self) -> bool:
         """Return True if the remote is on."""
         return self._is_on
 
-    @property
-    def activity_list(self) -> list[str]:
-        """Return list of available activities (command names)."""
-        return [cmd.name for cmd in self._virtual_device.commands.values()]
-
     @property
     def current_activity(self) -> str | None:
         """Return current activity (last sent command)."""
         return self._coordinator.last_sent_command.get(self._virtual_device.id)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "ir_blaster": self._virtual_device.ir_blaster_entity_id,
-            "command_count": len(self._virtual_device.commands),
-            "commands": list(self._virtual_device.commands.keys()),
-        }
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the remote."""
         self._is_on = True
@@ -121,21 +118,11 @@ class VirtualRemoteEntity(IRDeviceEntityMixin, RemoteEntity):
         num_repeats = kwargs.get("num_repeats", 1)
         delay_secs = kwargs.get("delay_secs", 0)
 
-        commands_list = list(command)
-        for i, cmd_name in enumerate(commands_list):
-            # Look up command case-insensitively
-            cmd_key = cmd_name.lower()
-            if cmd_key in self._virtual_device.commands:
-                await self._coordinator.async_send_command(
-                    self._virtual_device.id,
-                    cmd_name,
-                    num_repeats,
-                )
-                _LOGGER.debug("Sent command '%s' via remote", cmd_name)
-
-                # Add delay between commands (not after the last one)
-                if delay_secs > 0 and i < len(commands_list) - 1:
-                    await asyncio.sleep(delay_secs)
+        # Skip unknown commands, looked up case-insensitively
+        known_commands: list[str] = []
+        for cmd_name in command:
+            if self._virtual_device.has_command(cmd_name):
+                known_commands.append(cmd_name)
             else:
                 _LOGGER.warning(
                     "Command '%s' not found on device '%s'",
@@ -143,6 +130,14 @@ class VirtualRemoteEntity(IRDeviceEntityMixin, RemoteEntity):
                     self._virtual_device.name,
                 )
 
+        await self._coordinator.async_send_commands(
+            self._virtual_device.id,
+            known_commands,
+            num_repeats,
+            delay_secs,
+        )
+        _LOGGER.debug("Sent commands %s via remote", known_commands)
+
     async def async_learn_command(self, **kwargs: Any) -> None:
         """Learn a new command.
 
@@ -157,25 +152,14 @@ class VirtualRemoteEntity(IRDeviceEntityMixin, RemoteEntity):
             _LOGGER.error("No command name provided for learning")
             return
 
-        # Learn each command
-        for cmd_name in command:
-            try:
-                result = await self._coordinator.async_learn_command(
-                    self._virtual_device.id,
-                    cmd_name,
-                    command_type,
-                    timeout,
-                )
-                if result:
-                    _LOGGER.info("Successfully learned command '%s'", cmd_name)
-                else:
-                    _LOGGER.warning(
-                        "Could not automatically retrieve code for '%s'. "
-                        "Manual input may be required.",
-                        cmd_name,
-                    )
-            except Exception as err:
-                _LOGGER.error("Failed to learn command '%s': %s", cmd_name, err)
+        # Learn every command, then fetch the codes from the blaster at once.
+        # The coordinator logs the outcome for each command.
+        await self._coordinator.async_learn_commands(
+            self._virtual_device.id,
+            command,
+            command_type,
+            timeout,
+        )
 
     async def async_delete_command(self, **kwargs: Any) -> None:
         """Delete a learned command.
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    DATA_DEVICE_INDEX,
     DOMAIN,
     CONF_COMMAND_CODE,
     CONF_COMMAND_NAME,
@@ -73,10 +75,9 @@ SCHEMA_SEND_COMMAND = vol.Schema(
 
 def _get_coordinator(hass: HomeAssistant, device_id: str) -> "IRDeviceCoordinator":
     """Find coordinator for device or raise error."""
-    for entry_data in hass.data.get(DOMAIN, {}).values():
-        coordinator = entry_data.get("coordinator")
-        if coordinator and coordinator.get_device(device_id):
-            return coordinator
+    coordinator = hass.data.get(DOMAIN, {}).get(DATA_DEVICE_INDEX, {}).get(device_id)
+    if coordinator is not None:
+        return coordinator
     raise HomeAssistantError(f"Device '{device_id}' not found")
 
 
@@ -124,34 +125,21 @@ async def _handle_send_command(hass: HomeAssistant, call: ServiceCall) -> None:
 
 
 # Service definitions: (name, schema, handler)
-_SERVICES = [
+_SERVICES = (
     (SERVICE_LEARN_COMMAND, SCHEMA_LEARN_COMMAND, _handle_learn_command),
     (SERVICE_ADD_COMMAND, SCHEMA_ADD_COMMAND, _handle_add_command),
     (SERVICE_DELETE_COMMAND, SCHEMA_DELETE_COMMAND, _handle_delete_command),
     (SERVICE_SEND_COMMAND, SCHEMA_SEND_COMMAND, _handle_send_command),
-]
+)
 
 
-async def async_register_services(hass: HomeAssistant) -> None:
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
     """Register all integration services."""
     for name, schema, handler in _SERVICES:
         if hass.services.has_service(DOMAIN, name):
             continue
 
-        async def create_handler(h):
-            async def wrapped(call: ServiceCall) -> None:
-                await h(hass, call)
-            return wrapped
-
         hass.services.async_register(
-            DOMAIN,
-            name,
-            await create_handler(handler),
-            schema=schema,
+            DOMAIN, name, partial(handler, hass), schema=schema
         )
-
-
-def async_unregister_services(hass: HomeAssistant) -> None:
-    """Unregister all integration services."""
-    for name, _, _ in _SERVICES:
-        hass.services.async_remove(DOMAIN, name)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 import logging
+import sys
+from types import MappingProxyType
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -14,8 +17,23 @@ from .const import STORAGE_KEY, STORAGE_VERSION, DEVICE_TYPE_GENERIC
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to coalesce non-critical writes for
+SAVE_DELAY = 2
 
-@dataclass
+# Keys a stored device must have to be loaded
+_REQUIRED_DEVICE_KEYS = ("id", "name", "ir_blaster_entity_id")
+
+
+def command_key(name: str) -> str:
+    """Return the key a command is stored under in VirtualDevice.commands.
+
+    Keys are lowercased for case-insensitive lookups and interned since
+    the same few names are looked up on every send.
+    """
+    return sys.intern(name.lower())
+
+
+@dataclass(slots=True)
 class IRCommand:
     """A learned IR command."""
 
@@ -26,9 +44,21 @@ class IRCommand:
     learned_at: str = field(default_factory=lambda: dt_util.utcnow().isoformat())
     icon: str | None = None
 
+    @property
+    def command_type_display(self) -> str:
+        """Return the command type as shown in labels, e.g. "IR"."""
+        return self.command_type.upper()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "code": self.code,
+            "command_type": self.command_type,
+            "learned_at": self.learned_at,
+            "icon": self.icon,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> IRCommand:
@@ -38,12 +68,12 @@ class IRCommand:
             name=data["name"],
             code=data["code"],
             command_type=data.get("command_type", "ir"),
-            learned_at=data.get("learned_at", dt_util.utcnow().isoformat()),
+            learned_at=data.get("learned_at") or dt_util.utcnow().isoformat(),
             icon=data.get("icon"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityConfig:
     """Configuration for a specific entity type on a device."""
 
@@ -59,7 +89,16 @@ class EntityConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # The nested dicts are shared by reference, not copied, so the result
+        # must be serialized on the event loop (Store's default), where
+        # entities cannot mutate them mid-encode
+        return {
+            "entity_type": self.entity_type,
+            "enabled": self.enabled,
+            "command_mappings": self.command_mappings,
+            "state": self.state,
+            "options": self.options,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> EntityConfig:
@@ -73,7 +112,7 @@ class EntityConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualDevice:
     """A virtual remote device."""
 
@@ -84,14 +123,54 @@ class VirtualDevice:
     created_at: str = field(default_factory=lambda: dt_util.utcnow().isoformat())
     device_type: str = DEVICE_TYPE_GENERIC
     entity_configs: dict[str, EntityConfig] = field(default_factory=dict)
+    # Derived command caches, not persisted
+    _command_choices: Mapping[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _commands_dict: dict[str, dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def has_command(self, name: str) -> bool:
+        """Return if a command with this name exists, ignoring case."""
+        # Already-lowercased input matches without allocating a lowered copy
+        return name in self.commands or name.lower() in self.commands
+
+    @property
+    def command_choices(self) -> Mapping[str, str]:
+        """Return command labels keyed by name, sorted by name.
+
+        Cached until invalidate_command_cache() is called.
+        """
+        if self._command_choices is None:
+            self._command_choices = MappingProxyType(
+                {
+                    cmd.name: f"{cmd.name} ({cmd.command_type_display})"
+                    for cmd in sorted(
+                        self.commands.values(), key=lambda cmd: cmd.name.lower()
+                    )
+                }
+            )
+        return self._command_choices
+
+    def invalidate_command_cache(self) -> None:
+        """Drop derived command caches after commands change."""
+        self._command_choices = None
+        self._commands_dict = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+        """Convert to dictionary.
+
+        The serialized commands are cached until invalidate_command_cache()
+        is called, since saves are mostly triggered by entity state changes.
+        """
+        if self._commands_dict is None:
+            self._commands_dict = {k: v.to_dict() for k, v in self.commands.items()}
         return {
             "id": self.id,
             "name": self.name,
             "ir_blaster_entity_id": self.ir_blaster_entity_id,
-            "commands": {k: v.to_dict() for k, v in self.commands.items()},
+            "commands": self._commands_dict,
             "created_at": self.created_at,
             "device_type": self.device_type,
             "entity_configs": {k: v.to_dict() for k, v in self.entity_configs.items()},
@@ -99,21 +178,28 @@ class VirtualDevice:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> VirtualDevice:
-        """Create from dictionary."""
-        commands = {}
-        for cmd_key, cmd_data in data.get("commands", {}).items():
-            commands[cmd_key] = IRCommand.from_dict(cmd_data)
+        """Create from dictionary.
 
-        entity_configs = {}
-        for config_key, config_data in data.get("entity_configs", {}).items():
-            entity_configs[config_key] = EntityConfig.from_dict(config_data)
+        Raises ValueError listing every missing required key.
+        """
+        if missing := [key for key in _REQUIRED_DEVICE_KEYS if key not in data]:
+            raise ValueError(f"missing keys: {', '.join(missing)}")
+
+        commands = {
+            command_key(command.name): command
+            for command in map(IRCommand.from_dict, data.get("commands", {}).values())
+        }
+        entity_configs = {
+            config_key: EntityConfig.from_dict(config_data)
+            for config_key, config_data in data.get("entity_configs", {}).items()
+        }
 
         return cls(
             id=data["id"],
             name=data["name"],
             ir_blaster_entity_id=data["ir_blaster_entity_id"],
             commands=commands,
-            created_at=data.get("created_at", dt_util.utcnow().isoformat()),
+            created_at=data.get("created_at") or dt_util.utcnow().isoformat(),
             device_type=data.get("device_type", DEVICE_TYPE_GENERIC),
             entity_configs=entity_configs,
         )
@@ -130,74 +216,121 @@ class IRDeviceStorage:
             hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}"
         )
         self._devices: dict[str, VirtualDevice] = {}
+        # Lowercased device name -> device ID
+        self._name_index: dict[str, str] = {}
+        self._save_pending = False
 
     @property
     def devices(self) -> dict[str, VirtualDevice]:
         """Return all virtual devices."""
         return self._devices
 
+    @property
+    def device_names(self) -> Mapping[str, str]:
+        """Return device IDs keyed by lowercased device name."""
+        return self._name_index
+
     def get_device(self, device_id: str) -> VirtualDevice | None:
         """Get a virtual device by ID."""
         return self._devices.get(device_id)
 
     def get_device_by_name(self, name: str) -> VirtualDevice | None:
         """Get a virtual device by name."""
-        for device in self._devices.values():
-            if device.name.lower() == name.lower():
-                return device
-        return None
+        device_id = self._name_index.get(name.lower())
+        if device_id is None:
+            return None
+        return self._devices.get(device_id)
 
     async def async_load(self) -> None:
         """Load data from storage."""
         data = await self._store.async_load()
         if data is None:
             self._devices = {}
+            self._name_index = {}
             return
 
         # Handle storage migrations
         stored_version = data.get("version", 1)
         if stored_version < 2:
-            data = self._migrate_v1_to_v2(data)
-            # Save migrated data
-            await self._store.async_save(data)
-
-        self._devices = {}
+            data, migrated = self._migrate_v1_to_v2(data)
+            # Save migrated data; a bare version bump is written by the
+            # next regular save
+            if migrated:
+                await self._store.async_save(data)
+
+        # Build the devices and the name index in one pass. The try block
+        # costs nothing unless a device fails to load.
+        devices: dict[str, VirtualDevice] = {}
+        name_index: dict[str, str] = {}
+        from_dict = VirtualDevice.from_dict
         for device_id, device_data in data.get("virtual_devices", {}).items():
             try:
-                self._devices[device_id] = VirtualDevice.from_dict(device_data)
-            except (KeyError, TypeError) as err:
+                device = devices[device_id] = from_dict(device_data)
+            except (KeyError, TypeError, ValueError) as err:
                 _LOGGER.warning("Failed to load device %s: %s", device_id, err)
+                continue
+            name_index[device.name.lower()] = device_id
+
+        self._devices = devices
+        self._name_index = name_index
 
-    def _migrate_v1_to_v2(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Migrate from v1 to v2 - add device_type and entity_configs."""
+    def _migrate_v1_to_v2(
+        self, data: dict[str, Any]
+    ) -> tuple[dict[str, Any], bool]:
+        """Migrate from v1 to v2 - add device_type and entity_configs.
+
+        Returns the data and whether any device was changed.
+        """
         _LOGGER.info("Migrating storage from v1 to v2")
+        migrated = False
         for device_data in data.get("virtual_devices", {}).values():
             # Add new fields with defaults
-            device_data.setdefault("device_type", DEVICE_TYPE_GENERIC)
-            device_data.setdefault("entity_configs", {})
+            if "device_type" not in device_data:
+                device_data["device_type"] = DEVICE_TYPE_GENERIC
+                migrated = True
+            if "entity_configs" not in device_data:
+                device_data["entity_configs"] = {}
+                migrated = True
         data["version"] = 2
-        return data
+        return data, migrated
 
-    async def async_save(self) -> None:
-        """Save data to storage."""
-        data = {
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        self._save_pending = False
+        return {
             "version": STORAGE_VERSION,
             "virtual_devices": {
                 device_id: device.to_dict()
                 for device_id, device in self._devices.items()
             },
         }
-        await self._store.async_save(data)
+
+    async def async_save(self) -> None:
+        """Save data to storage now."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save data to storage after a short delay, coalescing writes."""
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write out a scheduled save immediately."""
+        if self._save_pending:
+            await self.async_save()
 
     async def async_add_device(self, device: VirtualDevice) -> None:
         """Add a virtual device."""
         self._devices[device.id] = device
+        self._name_index[device.name.lower()] = device.id
         await self.async_save()
 
     async def async_remove_device(self, device_id: str) -> bool:
         """Remove a virtual device."""
-        if device_id in self._devices:
-            del self._devices[device_id]
+        device = self._devices.pop(device_id, None)
+        if device is not None:
+            self._name_index.pop(device.name.lower(), None)
             await self.async_save()
             return True
         return False
@@ -210,8 +343,9 @@ class IRDeviceStorage:
         if device is None:
             return False
 
-        device.commands[command.name.lower()] = command
-        await self.async_save()
+        device.commands[command_key(command.name)] = command
+        device.invalidate_command_cache()
+        self.async_schedule_save()
         return True
 
     async def async_remove_command(
@@ -225,6 +359,7 @@ class IRDeviceStorage:
         key = command_name.lower()
         if key in device.commands:
             del device.commands[key]
-            await self.async_save()
+            device.invalidate_command_cache()
+            self.async_schedule_save()
             return True
         return False